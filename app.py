@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from numba import njit
+import xxhash
 
 st.set_page_config(page_title="FX Hedging Model", page_icon="💱", layout="wide")
 
@@ -30,52 +32,154 @@ hedge_coverage = st.sidebar.slider("Pokrycie hedgingiem (%)", 0, 100, 100) / 100
 otc_spread = st.sidebar.slider("Spread OTC (%)", 0.05, 0.50, 0.20, step=0.05) / 100
 bank_fx_spread = st.sidebar.slider("Spread bankowy EUR/PLN (%)", 0.05, 0.30, 0.15, step=0.05) / 100
 
-# Obliczenia
-months = np.arange(1, forecast_months + 1)
-
-# Interpolacja kursów (liniowa zmiana)
-usd_pln_path = np.linspace(usd_pln_start, usd_pln_end, forecast_months)
-eur_usd_path = np.linspace(eur_usd_start, eur_usd_end, forecast_months)
-
-# Kursy zablokowane (hedging)
-usd_pln_hedged = np.full(forecast_months, usd_pln_start)
-eur_usd_hedged = np.full(forecast_months, eur_usd_start)
-
 # Funkcja obliczająca koszty miesięczne
-def calc_monthly_costs(usd_pln, eur_usd):
-    pln_in_usd = monthly_pln_costs / usd_pln
-    eur_in_usd = monthly_eur_costs * eur_usd
-    return pln_in_usd + eur_in_usd
-
-# Koszty bez hedgingu
-costs_unhedged = np.array([calc_monthly_costs(usd_pln_path[i], eur_usd_path[i]) for i in range(forecast_months)])
-
-# Koszty z hedgingiem (mix)
-costs_hedged_part = np.array([calc_monthly_costs(usd_pln_hedged[i], eur_usd_hedged[i]) for i in range(forecast_months)])
-costs_hedged = hedge_coverage * costs_hedged_part + (1 - hedge_coverage) * costs_unhedged
-
-# Koszty hedgingu
-hedging_execution_costs = costs_hedged_part * hedge_coverage * (otc_spread + bank_fx_spread * (monthly_pln_costs / usd_pln_start) / costs_hedged_part)
+# (działa zarówno na skalarach, jak i na tablicach numpy)
+def calc_monthly_costs(usd_pln, eur_usd, monthly_pln_costs, monthly_eur_costs):
+    return monthly_pln_costs / usd_pln + monthly_eur_costs * eur_usd
+
+# Jądro modelu: interpolacja kursów -> koszty -> sumy skumulowane -> runway w jednej pętli
+# (kompilowane przez numba, bez tablic pośrednich)
+@njit(cache=True)
+def compute_all(treasury_usdt, monthly_eur_costs, monthly_pln_costs, forecast_months,
+                usd_pln_start, usd_pln_end, eur_usd_start, eur_usd_end,
+                hedge_coverage, otc_spread, bank_fx_spread):
+    # Wszystkie wyniki w float64 (kwoty muszą się zgadzać co do centa);
+    # rzutowanie na float32 dopiero przy przekazaniu danych do wykresów
+    usd_pln_path = np.empty(forecast_months, dtype=np.float64)
+    eur_usd_path = np.empty(forecast_months, dtype=np.float64)
+    costs_unhedged = np.empty(forecast_months, dtype=np.float64)
+    costs_hedged = np.empty(forecast_months, dtype=np.float64)
+    cumulative_unhedged = np.empty(forecast_months, dtype=np.float64)
+    cumulative_hedged = np.empty(forecast_months, dtype=np.float64)
+
+    # Kursy zablokowane (hedging) - koszt zabezpieczonej części i koszt hedgingu są stałe
+    pln_usd_const = monthly_pln_costs / usd_pln_start
+    hedged_monthly_cost = pln_usd_const + monthly_eur_costs * eur_usd_start
+    hedging_execution_cost = hedge_coverage * (hedged_monthly_cost * otc_spread + bank_fx_spread * pln_usd_const)
+
+    # Interpolacja afiniczna: wspólny krok dla obu ścieżek, liczony raz przed pętlą
+    frac_step = 1.0 / (forecast_months - 1) if forecast_months > 1 else 0.0
+    usd_pln_step = (usd_pln_end - usd_pln_start) * frac_step
+    eur_usd_step = (eur_usd_end - eur_usd_start) * frac_step
+    spent_unhedged = 0.0
+    spent_hedged = 0.0
+    # Runway: pierwszy miesiąc, w którym skumulowane koszty przekraczają treasury
+    runway_unhedged = float(forecast_months)
+    runway_hedged = float(forecast_months)
+    found_unhedged = False
+    found_hedged = False
+    for i in range(forecast_months):
+        usd_pln = usd_pln_start + usd_pln_step * i
+        eur_usd = eur_usd_start + eur_usd_step * i
+        cost_unhedged = monthly_pln_costs / usd_pln + monthly_eur_costs * eur_usd
+        cost_hedged = hedge_coverage * hedged_monthly_cost + (1 - hedge_coverage) * cost_unhedged
+        cost_hedged_total = cost_hedged + hedging_execution_cost
+        if not found_unhedged and spent_unhedged + cost_unhedged >= treasury_usdt:
+            runway_unhedged = i + (treasury_usdt - spent_unhedged) / cost_unhedged
+            found_unhedged = True
+        if not found_hedged and spent_hedged + cost_hedged_total >= treasury_usdt:
+            runway_hedged = i + (treasury_usdt - spent_hedged) / cost_hedged_total
+            found_hedged = True
+        spent_unhedged += cost_unhedged
+        spent_hedged += cost_hedged_total
+        usd_pln_path[i] = usd_pln
+        eur_usd_path[i] = eur_usd
+        costs_unhedged[i] = cost_unhedged
+        costs_hedged[i] = cost_hedged
+        cumulative_unhedged[i] = spent_unhedged
+        cumulative_hedged[i] = spent_hedged
+
+    hedging_execution_costs = np.full(forecast_months, hedging_execution_cost, dtype=np.float64)
+    return (usd_pln_path, eur_usd_path, costs_unhedged, costs_hedged, hedging_execution_costs,
+            cumulative_unhedged, cumulative_hedged, runway_unhedged, runway_hedged)
+
+# Scenariusze kursowe
+SCENARIOS = {
+    "Silny USD": {"usd_pln": 3.85, "eur_usd": 1.10, "prob": 0.15},
+    "Stabilizacja": {"usd_pln": 3.58, "eur_usd": 1.18, "prob": 0.25},
+    "Konsensus (słaby USD)": {"usd_pln": 3.50, "eur_usd": 1.20, "prob": 0.60},
+}
+
+# Cały model liczbowy - Streamlit zwraca wynik z cache, gdy parametry się nie zmieniły
+@st.cache_data
+def compute_model(treasury_usdt, monthly_eur_costs, monthly_pln_costs, forecast_months,
+                  usd_pln_start, usd_pln_end, eur_usd_start, eur_usd_end,
+                  hedge_coverage, otc_spread, bank_fx_spread):
+    months = np.arange(1, forecast_months + 1, dtype=np.int64)
+
+    (usd_pln_path, eur_usd_path, costs_unhedged, costs_hedged, hedging_execution_costs,
+     cumulative_unhedged, cumulative_hedged, runway_unhedged, runway_hedged) = compute_all(
+        float(treasury_usdt), float(monthly_eur_costs), float(monthly_pln_costs), forecast_months,
+        usd_pln_start, usd_pln_end, eur_usd_start, eur_usd_end,
+        hedge_coverage, otc_spread, bank_fx_spread)
+
+    # Pozostałe treasury
+    treasury_unhedged = treasury_usdt - cumulative_unhedged
+    treasury_hedged = treasury_usdt - cumulative_hedged
+
+    return {
+        "months": months,
+        "usd_pln_path": usd_pln_path,
+        "eur_usd_path": eur_usd_path,
+        "costs_unhedged": costs_unhedged,
+        "costs_hedged": costs_hedged,
+        "hedging_execution_costs": hedging_execution_costs,
+        "cumulative_unhedged": cumulative_unhedged,
+        "cumulative_hedged": cumulative_hedged,
+        "treasury_unhedged": treasury_unhedged,
+        "treasury_hedged": treasury_hedged,
+        "runway_unhedged": runway_unhedged,
+        "runway_hedged": runway_hedged,
+    }
 
-# Skumulowane koszty
-cumulative_unhedged = np.cumsum(costs_unhedged)
-cumulative_hedged = np.cumsum(costs_hedged + hedging_execution_costs)
+# Analiza scenariuszy - zależy tylko od kursów początkowych, nie od ścieżki ani pokrycia hedgingiem
+@st.cache_data
+def compute_scenarios(treasury_usdt, monthly_eur_costs, monthly_pln_costs, forecast_months,
+                      usd_pln_start, eur_usd_start, otc_spread, bank_fx_spread):
+    # Parametry scenariuszy jako tablice - wszystkie metryki liczone jednym wyrażeniem
+    sc_names = list(SCENARIOS.keys())
+    sc_usd_pln = np.array([s["usd_pln"] for s in SCENARIOS.values()])
+    sc_eur_usd = np.array([s["eur_usd"] for s in SCENARIOS.values()])
+    sc_prob = np.array([s["prob"] for s in SCENARIOS.values()])
 
-# Pozostałe treasury
-treasury_unhedged = treasury_usdt - cumulative_unhedged
-treasury_hedged = treasury_usdt - cumulative_hedged
+    sc_monthly = calc_monthly_costs(sc_usd_pln, sc_eur_usd, monthly_pln_costs, monthly_eur_costs)
+    sc_total = sc_monthly * forecast_months
+    sc_runway = treasury_usdt / sc_monthly
 
-# Runway calculation
-def calc_runway(treasury, monthly_costs):
-    remaining = treasury
-    for i, cost in enumerate(monthly_costs):
-        remaining -= cost
-        if remaining <= 0:
-            return i + (remaining + cost) / cost
-    return len(monthly_costs)
+    # Expected value
+    ev_unhedged = (sc_total * sc_prob).sum()
+    ev_hedged = calc_monthly_costs(usd_pln_start, eur_usd_start, monthly_pln_costs, monthly_eur_costs) * forecast_months * (1 + otc_spread + bank_fx_spread)
+    sc_savings = sc_total - ev_hedged
+
+    df_scenarios = pd.DataFrame({
+        "Scenariusz": sc_names,
+        "Prawdop.": [f"{p*100:.0f}%" for p in sc_prob],
+        "USD/PLN": sc_usd_pln,
+        "EUR/USD": sc_eur_usd,
+        "Koszt mies. (USD)": [f"{v:,.0f}" for v in sc_monthly],
+        "Koszt total (USD)": [f"{v:,.0f}" for v in sc_total],
+        "Runway (mies.)": [f"{v:.1f}" for v in sc_runway],
+        "Oszczędn. z hedge": [f"{v:,.0f}" for v in sc_savings],
+    })
+
+    return df_scenarios, ev_unhedged, ev_hedged
 
-runway_unhedged = calc_runway(treasury_usdt, costs_unhedged)
-runway_hedged = calc_runway(treasury_usdt, costs_hedged + hedging_execution_costs)
+# Obliczenia
+model = compute_model(treasury_usdt, monthly_eur_costs, monthly_pln_costs, forecast_months,
+                      usd_pln_start, usd_pln_end, eur_usd_start, eur_usd_end,
+                      hedge_coverage, otc_spread, bank_fx_spread)
+months = model["months"]
+usd_pln_path = model["usd_pln_path"]
+eur_usd_path = model["eur_usd_path"]
+costs_unhedged = model["costs_unhedged"]
+costs_hedged = model["costs_hedged"]
+hedging_execution_costs = model["hedging_execution_costs"]
+cumulative_unhedged = model["cumulative_unhedged"]
+cumulative_hedged = model["cumulative_hedged"]
+treasury_unhedged = model["treasury_unhedged"]
+treasury_hedged = model["treasury_hedged"]
+runway_unhedged = model["runway_unhedged"]
+runway_hedged = model["runway_hedged"]
 
 # Layout główny
 col1, col2, col3, col4 = st.columns(4)
@@ -93,68 +197,74 @@ with col4:
 st.markdown("---")
 
 # Wykresy
-tab1, tab2, tab3, tab4 = st.tabs(["📈 Kursy walutowe", "💰 Koszty operacyjne", "🏦 Treasury", "📊 Analiza scenariuszy"])
-
-with tab1:
+# (szkielet figury - subploty, ślady, layout - budowany raz na sesję w st.session_state; przy kolejnych
+#  przebiegach podmieniamy tylko dane śladów, bez make_subplots/add_trace/update_layout.
+#  st.plotly_chart i tak serializuje całą figurę przy każdym przebiegu.)
+# Wersja szkieletów - podnieść po każdej zmianie funkcji build_*_fig, żeby otwarte sesje przebudowały figury
+FIG_VERSION = 1
+
+def _session_fig(key, build_fig, traces_xy):
+    version = (build_fig.__name__, FIG_VERSION)
+    cached = st.session_state.get(key)
+    if cached is None or cached[0] != version:
+        cached = (version, build_fig())
+        st.session_state[key] = cached
+    fig = cached[1]
+    if len(fig.data) != len(traces_xy):
+        raise ValueError(f"{key}: {len(fig.data)} śladów, {len(traces_xy)} serii danych")
+    for trace, (x, y) in zip(fig.data, traces_xy):
+        trace.x = x
+        trace.y = y
+    return fig
+
+def build_fx_fig():
     fig = make_subplots(rows=1, cols=2, subplot_titles=("USD/PLN", "EUR/USD"))
-    fig.add_trace(go.Scatter(x=months, y=usd_pln_path, name="USD/PLN (rynek)", line=dict(color="red")), row=1, col=1)
-    fig.add_trace(go.Scatter(x=months, y=usd_pln_hedged, name="USD/PLN (hedge)", line=dict(color="green", dash="dash")), row=1, col=1)
-    fig.add_trace(go.Scatter(x=months, y=eur_usd_path, name="EUR/USD (rynek)", line=dict(color="blue")), row=1, col=2)
-    fig.add_trace(go.Scatter(x=months, y=eur_usd_hedged, name="EUR/USD (hedge)", line=dict(color="green", dash="dash")), row=1, col=2)
+    fig.add_trace(go.Scattergl(name="USD/PLN (rynek)", line=dict(color="red")), row=1, col=1)
+    fig.add_trace(go.Scattergl(name="USD/PLN (hedge)", line=dict(color="green", dash="dash")), row=1, col=1)
+    fig.add_trace(go.Scattergl(name="EUR/USD (rynek)", line=dict(color="blue")), row=1, col=2)
+    fig.add_trace(go.Scattergl(name="EUR/USD (hedge)", line=dict(color="green", dash="dash")), row=1, col=2)
     fig.update_layout(height=400, title_text="Ścieżki kursów walutowych")
     fig.update_xaxes(title_text="Miesiąc")
+    return fig
+
+def build_costs_fig():
+    fig = go.Figure()
+    # Słupki obok siebie przez stałe przesunięcie (offset/width) zamiast barmode="group" liczonego w przeglądarce
+    fig.add_trace(go.Bar(name="Bez hedgingu", marker_color="red", opacity=0.7, offset=-0.4, width=0.4))
+    fig.add_trace(go.Bar(name="Z hedgingiem", marker_color="green", opacity=0.7, offset=0.0, width=0.4))
+    fig.add_trace(go.Scatter(name="Koszt hedgingu", line=dict(color="orange", dash="dot")))
+    fig.update_layout(height=400, title_text="Miesięczne koszty operacyjne (USD)", barmode="overlay", xaxis_title="Miesiąc", yaxis_title="USD")
+    return fig
+
+def build_treasury_fig():
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(name="Bez hedgingu", fill="tozeroy", line=dict(color="red")))
+    fig.add_trace(go.Scattergl(name="Z hedgingiem", fill="tozeroy", line=dict(color="green")))
+    fig.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="Zero")
+    fig.update_layout(height=400, title_text="Pozostałe Treasury (USDT)", xaxis_title="Miesiąc", yaxis_title="USDT")
+    return fig
+
+# (zawartość zakładek; scenariusze liczone przez compute_scenarios z własnym, węższym kluczem cache)
+def render_fx_tab(months, usd_pln_path, usd_pln_start, eur_usd_path, eur_usd_start):
+    # Kursy zablokowane (hedging)
+    usd_pln_hedged = np.full(len(months), usd_pln_start, dtype=np.float32)
+    eur_usd_hedged = np.full(len(months), eur_usd_start, dtype=np.float32)
+    fig = _session_fig("fig_tab1", build_fx_fig, [
+        (months, usd_pln_path.astype(np.float32)),
+        (months, usd_pln_hedged),
+        (months, eur_usd_path.astype(np.float32)),
+        (months, eur_usd_hedged),
+    ])
     st.plotly_chart(fig, use_container_width=True)
 
-with tab2:
-    fig2 = go.Figure()
-    fig2.add_trace(go.Bar(x=months, y=costs_unhedged, name="Bez hedgingu", marker_color="red", opacity=0.7))
-    fig2.add_trace(go.Bar(x=months, y=costs_hedged, name="Z hedgingiem", marker_color="green", opacity=0.7))
-    fig2.add_trace(go.Scatter(x=months, y=hedging_execution_costs, name="Koszt hedgingu", line=dict(color="orange", dash="dot")))
-    fig2.update_layout(height=400, title_text="Miesięczne koszty operacyjne (USD)", barmode="group", xaxis_title="Miesiąc", yaxis_title="USD")
-    st.plotly_chart(fig2, use_container_width=True)
-
-with tab3:
-    fig3 = go.Figure()
-    fig3.add_trace(go.Scatter(x=months, y=treasury_unhedged, name="Bez hedgingu", fill="tozeroy", line=dict(color="red")))
-    fig3.add_trace(go.Scatter(x=months, y=treasury_hedged, name="Z hedgingiem", fill="tozeroy", line=dict(color="green")))
-    fig3.add_hline(y=0, line_dash="dash", line_color="black", annotation_text="Zero")
-    fig3.update_layout(height=400, title_text="Pozostałe Treasury (USDT)", xaxis_title="Miesiąc", yaxis_title="USDT")
-    st.plotly_chart(fig3, use_container_width=True)
-
-with tab4:
+def render_scenarios_tab(treasury_usdt, monthly_eur_costs, monthly_pln_costs, forecast_months,
+                         usd_pln_start, eur_usd_start, otc_spread, bank_fx_spread):
     st.subheader("Analiza scenariuszy")
-    scenarios = {
-        "Silny USD": {"usd_pln": 3.85, "eur_usd": 1.10, "prob": 0.15},
-        "Stabilizacja": {"usd_pln": 3.58, "eur_usd": 1.18, "prob": 0.25},
-        "Konsensus (słaby USD)": {"usd_pln": 3.50, "eur_usd": 1.20, "prob": 0.60},
-    }
-    
-    scenario_results = []
-    for name, params in scenarios.items():
-        monthly_cost = calc_monthly_costs(params["usd_pln"], params["eur_usd"])
-        total_cost = monthly_cost * forecast_months
-        runway = treasury_usdt / monthly_cost
-        hedged_cost = calc_monthly_costs(usd_pln_start, eur_usd_start)
-        hedged_total = hedged_cost * forecast_months * (1 + otc_spread + bank_fx_spread)
-        savings = total_cost - hedged_total
-        scenario_results.append({
-            "Scenariusz": name,
-            "Prawdop.": f"{params['prob']*100:.0f}%",
-            "USD/PLN": params["usd_pln"],
-            "EUR/USD": params["eur_usd"],
-            "Koszt mies. (USD)": f"{monthly_cost:,.0f}",
-            "Koszt total (USD)": f"{total_cost:,.0f}",
-            "Runway (mies.)": f"{runway:.1f}",
-            "Oszczędn. z hedge": f"{savings:,.0f}"
-        })
-    
-    df_scenarios = pd.DataFrame(scenario_results)
+    df_scenarios, ev_unhedged, ev_hedged = compute_scenarios(
+        treasury_usdt, monthly_eur_costs, monthly_pln_costs, forecast_months,
+        usd_pln_start, eur_usd_start, otc_spread, bank_fx_spread)
     st.dataframe(df_scenarios, use_container_width=True, hide_index=True)
     
-    # Expected value
-    ev_unhedged = sum(calc_monthly_costs(s["usd_pln"], s["eur_usd"]) * forecast_months * s["prob"] for s in scenarios.values())
-    ev_hedged = calc_monthly_costs(usd_pln_start, eur_usd_start) * forecast_months * (1 + otc_spread + bank_fx_spread)
-    
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Expected Value (bez hedge)", f"{ev_unhedged:,.0f} USD")
@@ -163,22 +273,58 @@ with tab4:
     with col3:
         st.metric("Expected oszczędności", f"{ev_unhedged - ev_hedged:,.0f} USD")
 
+tab1, tab2, tab3, tab4 = st.tabs(["📈 Kursy walutowe", "💰 Koszty operacyjne", "🏦 Treasury", "📊 Analiza scenariuszy"])
+
+with tab1:
+    render_fx_tab(months, usd_pln_path, usd_pln_start, eur_usd_path, eur_usd_start)
+
+with tab2:
+    fig2 = _session_fig("fig_tab2", build_costs_fig, [
+        (months, costs_unhedged.astype(np.float32)),
+        (months, costs_hedged.astype(np.float32)),
+        (months, hedging_execution_costs.astype(np.float32)),
+    ])
+    st.plotly_chart(fig2, use_container_width=True)
+
+with tab3:
+    fig3 = _session_fig("fig_tab3", build_treasury_fig, [
+        (months, treasury_unhedged.astype(np.float32)),
+        (months, treasury_hedged.astype(np.float32)),
+    ])
+    st.plotly_chart(fig3, use_container_width=True)
+
+with tab4:
+    render_scenarios_tab(treasury_usdt, monthly_eur_costs, monthly_pln_costs, forecast_months,
+                         usd_pln_start, eur_usd_start, otc_spread, bank_fx_spread)
+
 # Tabela szczegółowa
+# (klucz cache dla tablic numpy: Streamlit domyślnie też haszuje tobytes(), xxhash daje po prostu szybszy skrót)
+def _hash_ndarray(a):
+    return a.dtype.str, a.shape, xxhash.xxh64(a.tobytes()).intdigest()
+
+NDARRAY_HASH_FUNCS = {np.ndarray: _hash_ndarray}
+
+@st.cache_data(hash_funcs=NDARRAY_HASH_FUNCS)
+def build_detail_df(months, usd_pln_path, eur_usd_path, costs_unhedged, costs_hedged,
+                    hedging_execution_costs, treasury_unhedged, treasury_hedged):
+    # Zaokrąglamy kolumny przed zbudowaniem DataFrame
+    return pd.DataFrame({
+        "Miesiąc": months,
+        "USD/PLN": np.round(usd_pln_path, 2),
+        "EUR/USD": np.round(eur_usd_path, 3),
+        "Koszt bez hedge (USD)": np.round(costs_unhedged, 2),
+        "Koszt z hedge (USD)": np.round(costs_hedged, 2),
+        "Koszt hedgingu (USD)": np.round(hedging_execution_costs, 2),
+        "Treasury bez hedge": np.round(treasury_unhedged, 2),
+        "Treasury z hedge": np.round(treasury_hedged, 2),
+    })
+
 st.markdown("---")
-st.subheader("📋 Szczegółowe zestawienie miesięczne")
-
-df = pd.DataFrame({
-    "Miesiąc": months,
-    "USD/PLN": usd_pln_path,
-    "EUR/USD": eur_usd_path,
-    "Koszt bez hedge (USD)": costs_unhedged,
-    "Koszt z hedge (USD)": costs_hedged,
-    "Koszt hedgingu (USD)": hedging_execution_costs,
-    "Treasury bez hedge": treasury_unhedged,
-    "Treasury z hedge": treasury_hedged,
-})
-df = df.round(2)
-st.dataframe(df, use_container_width=True, hide_index=True)
+with st.expander("📋 Szczegółowe zestawienie miesięczne", expanded=False):
+    df = build_detail_df(months, usd_pln_path, eur_usd_path, costs_unhedged,
+                         costs_hedged, hedging_execution_costs, treasury_unhedged,
+                         treasury_hedged)
+    st.dataframe(df, use_container_width=True, hide_index=True)
 
 # Podsumowanie
 st.markdown("---")
@@ -203,10 +349,8 @@ else:
     - Bilans: **{total_diff - total_hedging_cost:,.0f} USD**
     """)
 
-st.markdown("""
----
-### 🚀 Jak uruchomić na GitHub
-
+# Instrukcja wdrożenia - statyczny tekst w stałej modułu, wyświetlany w zwiniętym expanderze
+DEPLOY_DOCS_MD = """
 1. Stwórz nowe repo na GitHub
 2. Dodaj plik `requirements.txt`:
 ```
@@ -214,6 +358,9 @@ streamlit
 pandas
 numpy
 plotly
+numba
+xxhash
+orjson
 ```
 
 3. Dodaj plik `app.py` z tym kodem
@@ -223,4 +370,8 @@ plotly
    - Wybierz repo i branch
    - Wskaż `app.py` jako główny plik
    - Deploy!
-""")
+"""
+
+st.markdown("---")
+with st.expander("🚀 Jak uruchomić na GitHub", expanded=False):
+    st.markdown(DEPLOY_DOCS_MD)